@@ -12,20 +12,40 @@ Sample Data includes:
 - sampleReciters kotlin list
 - sampleSurahs kotlin list
 
+API responses are cached in the `.cache` directory next to this script for 24 hours,
+after which they are revalidated with the server using their ETag. SampleData.kt is only
+rewritten when the fetched data (or this script) changed since it was last generated, or when
+SampleData.kt itself was modified since.
+
+The data set is small (a few hundred reciters and 114 surahs), so the run time is dominated
+by the network and formatting the Kotlin code is a single-threaded pass over the parsed JSON.
+Parallelizing the formatting (e.g. with a process pool) would cost more in process startup
+than it saves and is deliberately not done.
+
 Usage:
-    python generateSampleData.py
+    python generateSampleData.py [--verbose] [--no-cache]
+
+Options:
+    --verbose: Print the generated Kotlin code to stdout while writing it
+    --no-cache: Ignore the cached API responses and fetch them again, and regenerate SampleData.kt even if it is up to date
 """
 
+import argparse
 import os
+import re
 import sys
-from dataclasses import dataclass, fields, is_dataclass
-from typing import TypeVar
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import blake2b, sha1
+from json import dumps as jsonDumps
+from json import loads as jsonLoads
+from pathlib import Path
+from time import time
+from typing import TypedDict
 
 import requests
 from requests import Response
 from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
-from typing_extensions import Annotated, get_args, get_origin
 from urllib3.util.retry import Retry
 
 sys.stdout.reconfigure(encoding="utf-8")
@@ -45,268 +65,297 @@ The editor's indentation.
 This is the string representation of the indentation used in the generated Kotlin code.
 """
 
-T = TypeVar("T")
+INDENT_2 = EDITOR_INDENT * 2
+"""
+Two levels of the editor's indentation, used for the list items in the generated Kotlin code.
 """
-Generic type variable.
 
-This type variable is used to indicate that a type is a generic type.
+INDENT_4 = EDITOR_INDENT * 4
+"""
+Four levels of the editor's indentation, used for the Reciter properties in the generated Kotlin code.
 """
 
+INDENT_6 = EDITOR_INDENT * 6
+"""
+Six levels of the editor's indentation, used for the Moshaf list items in the generated Kotlin code.
+"""
 
-@dataclass
-class Surah:
-    """
-    A class representing a Surah (chapter) of the Quran.
+INDENT_8 = EDITOR_INDENT * 8
+"""
+Eight levels of the editor's indentation, used for the Moshaf properties in the generated Kotlin code.
+"""
+
+MOSHAF_SEPARATOR = f",\n{INDENT_6}"
+"""
+The separator between the Moshafs of a Reciter's Moshaf list in the generated Kotlin code.
+"""
+
+KOTLIN_STRING_ESCAPES = str.maketrans(
+    {"\\": "\\\\", '"': '\\"', "\n": "\\n", "\r": "\\r", "$": "\\$"}
+)
+"""
+The translation table escaping the characters that are special inside a Kotlin string literal.
+"""
+
+KOTLIN_STRING_SPECIAL_CHARACTERS = re.compile(r'[\\"\n\r$]')
+"""
+A pattern matching any of the characters escaped by :data:`KOTLIN_STRING_ESCAPES`.
+"""
+
+SURAH_TEMPLATE = (
+    'Surah(id = %s, name = "%s", startPage = %s, endPage = %s, makkia = %s, type = %s)'
+)
+"""
+The Kotlin template of a Surah, formatted with a
+`(id, name, startPage, endPage, makkia, type)` tuple.
+"""
+
+MOSHAF_TEMPLATE = (
+    "Moshaf(\n"
+    f"{INDENT_8}id = %s,\n"
+    f'{INDENT_8}name = "%s",\n'
+    f'{INDENT_8}server = "%s",\n'
+    f"{INDENT_8}surahsCount = %s,\n"
+    f"{INDENT_8}moshafType = %s,\n"
+    f'{INDENT_8}surahIdsStr = "%s"\n'
+    f"{INDENT_6})"
+)
+"""
+The Kotlin template of a Moshaf, formatted with a
+`(id, name, server, surahsCount, moshafType, surahIdsStr)` tuple.
+"""
+
+RECITER_TEMPLATE = (
+    f"{INDENT_2}Reciter(\n"
+    f"{INDENT_4}id = %s.asReciterId,\n"
+    f'{INDENT_4}name = "%s",\n'
+    f'{INDENT_4}letter = "%s",\n'
+    f'{INDENT_4}date = "%s",\n'
+    f"{INDENT_4}moshafList = listOf(\n"
+    f"{INDENT_6}%s\n"
+    f"{INDENT_4})\n"
+    f"{INDENT_2})"
+)
+"""
+The Kotlin template of a Reciter, formatted with a
+`(id, name, letter, date, moshafList)` tuple.
+"""
+
+CACHE_DIR = Path(__file__).resolve().parent / ".cache"
+"""
+The directory of the on-disk API response cache.
+"""
+
+CACHE_EXPIRY_SECONDS = 24 * 60 * 60
+"""
+The age in seconds after which a cached API response is revalidated with the server.
+"""
+
+OUTPUT_HASH_PATH = CACHE_DIR / "SampleData.kt.hash"
+"""
+The file storing the hash of the data (and generator) the current SampleData.kt was generated from,
+followed by the hash of the generated SampleData.kt itself.
+"""
+
+RETRY_STRATEGY = Retry(
+    total=3,
+    connect=3,
+    read=3,
+    backoff_factor=0.25,
+    status_forcelist=(500, 502, 503, 504),
+    allowed_methods=frozenset(["GET"]),
+    raise_on_status=False,
+)
+"""
+The retry strategy used for all requests.
 
-    This class is a dataclass that holds information about a Surah. It has the following attributes:
-    Throws a :class:`Moshaf`.
+only connection errors, read errors and transient server errors (5xx) are retried,
+permanent failures such as 4xx responses are returned immediately.
+
+delay between retries is calculated as:
+backoff factor * (2 ^ number of previous retries)
+where the first retry is immediate, so 0ms, 500ms, 1s
+"""
+
+HTTP_ADAPTER = HTTPAdapter(
+    pool_connections=4, pool_maxsize=4, max_retries=RETRY_STRATEGY
+)
+"""
+The HTTP adapter mounted on the shared session.
+
+This adapter keeps a small pool of keep-alive connections so that requests to the same host
+reuse an already established TCP/TLS connection.
+"""
+
+SESSION = requests.session()
+"""
+The shared HTTP session.
+
+This session is created once and reused by every call to :func:`sendRequest`.
+"""
+SESSION.mount(prefix="http://", adapter=HTTP_ADAPTER)
+SESSION.mount(prefix="https://", adapter=HTTP_ADAPTER)
+
+
+class SurahData(TypedDict):
+    """
+    A dictionary representing a Surah (chapter) of the Quran, as returned by the mp3quran.net API.
 
     Attributes:
        id: (int) The unique identifier of the Surah.
        name: (str) The name of the Surah.
-       startPage: (int) The starting page number of the Surah in the Quran.
-       endPage: (int) The ending page number of the Surah in the Quran.
+       start_page: (int) The starting page number of the Surah in the Quran.
+       end_page: (int) The ending page number of the Surah in the Quran.
        makkia: (int) A flag indicating whether the Surah is considered Makkia or not.
        type: (int) The type of the Surah.
     """
 
     id: int
     name: str
-    startPage: Annotated[int, "start_page"]
-    endPage: Annotated[int, "end_page"]
+    start_page: int
+    end_page: int
     makkia: int
     type: int
 
-    def __toString__(self) -> str:
-        """
-        Returns a string representation of the Surah object.
-
-        :return: (str) A string representation of the Surah object.
-        """
-        return (
-            "Surah("
-            + f"id = {self.id}, "
-            + f'name = "{self.name}", '
-            + f"startPage = {self.startPage}, "
-            + f"endPage = {self.endPage}, "
-            + f"makkia = {self.makkia}, "
-            + f"type = {self.type}"
-            + ")"
-        )
-
-    def __str__(self) -> str:
-        """
-        Returns a string representation of the Surah object.
 
-        :return: (str) A string representation of the Surah object.
-        """
-        return self.__toString__()
-
-    def __repr__(self) -> str:
-        """
-        Returns a string representation of the Surah object.
-
-        :return: (str) A string representation of the Surah object.
-        """
-        return self.__toString__()
-
-
-@dataclass
-class Moshaf:
+class MoshafData(TypedDict):
     """
-    A class representing a Moshaf (Quran recitation).
-
-    This class is a dataclass that holds information about a Moshaf, which is a recitation of the Quran. It has the following attributes:
+    A dictionary representing a Moshaf (Quran recitation), as returned by the mp3quran.net API.
 
     Attributes:
        id: (int) The unique identifier of the Moshaf.
        name: (str) The name of the Moshaf.
        server: (str) The server URL hosting the Moshaf.
-       surahsCount: (int) The total number of Surahs in the Moshaf.
-       moshafType: (int) The type of the Moshaf.
-       surahIdsStr: (str) The list of Surah IDs in the Moshaf.
+       surah_total: (int) The total number of Surahs in the Moshaf.
+       moshaf_type: (int) The type of the Moshaf.
+       surah_list: (str) The list of Surah IDs in the Moshaf.
     """
 
     id: int
     name: str
     server: str
-    surahsCount: Annotated[int, "surah_total"]
-    moshafType: Annotated[int, "moshaf_type"]
-    surahIdsStr: Annotated[str, "surah_list"]
+    surah_total: int
+    moshaf_type: int
+    surah_list: str
 
-    def __toString__(self, withIndent: bool = False) -> str:
-        """
-        Returns a string representation of the Moshaf object.
 
-        :param withIndent: (bool) Whether to include indentation in the string representation. Defaults to False.
-        :return: (str) A string representation of the Moshaf object.
-        """
-        return (
-            "Moshaf(\n"
-            + f"{EDITOR_INDENT * 8 if withIndent else ''}id = {self.id},\n"
-            + f'{EDITOR_INDENT * 8 if withIndent else ""}name = "{self.name}",\n'
-            + f'{EDITOR_INDENT * 8 if withIndent else ""}server = "{self.server}",\n'
-            + f"{EDITOR_INDENT * 8 if withIndent else ''}surahsCount = {self.surahsCount},\n"
-            + f"{EDITOR_INDENT * 8 if withIndent else ''}moshafType = {self.moshafType},\n"
-            + f'{EDITOR_INDENT * 8 if withIndent else ""}surahIdsStr = "{self.surahIdsStr}"\n'
-            + f"{EDITOR_INDENT * 6 if withIndent else ''})"
-        )
-
-    def __str__(self) -> str:
-        """
-        Returns a string representation of the Moshaf object.
-
-        :return: (str) A string representation of the Moshaf object.
-        """
-        return self.__toString__(withIndent=True)
-
-    def __repr__(self) -> str:
-        """
-        Returns a string representation of the Moshaf object.
-
-        :return: (str) A string representation of the Moshaf object.
-        """
-        return self.__toString__()
-
-
-@dataclass
-class Reciter:
+class ReciterData(TypedDict):
     """
-    A class representing a Reciter (Quran reciter).
-
-    This class is a dataclass that holds information about a Reciter, which is a person who recites the Quran. It has the following attributes:
+    A dictionary representing a Reciter (Quran reciter), as returned by the mp3quran.net API.
 
     Attributes:
        id: (int) The unique identifier of the Reciter.
        name: (str) The name of the Reciter.
        letter: (str) The letter representing the Reciter.
        date: (str) The date of the Reciter's recitation.
-       moshafList: (list[Moshaf]) The list of Moshafs (recitations) by the Reciter.
+       moshaf: (list[MoshafData]) The list of Moshafs (recitations) by the Reciter.
     """
 
     id: int
     name: str
     letter: str
     date: str
-    moshafList: Annotated[list[Moshaf], "moshaf"]
-
-    def __toString__(self, withIndent: bool = False) -> str:
-        """
-        Returns a string representation of the Reciter object.
+    moshaf: list[MoshafData]
 
-        :param withIndent: (bool) Whether to include indentation in the string representation. Defaults to False.
-        :return: (str) A string representation of the Reciter object.
-        """
-        moshafList = f",\n{EDITOR_INDENT * 6 if withIndent else ''}".join(
-            f"{str(moshaf) if withIndent else repr(moshaf)}"
-            for moshaf in self.moshafList
-        )
 
-        return (
-            f"{EDITOR_INDENT * 2 if withIndent else ''}Reciter(\n"
-            + f"{EDITOR_INDENT * 4 if withIndent else ''}id = {self.id}.asReciterId,\n"
-            + f'{EDITOR_INDENT * 4 if withIndent else ""}name = "{self.name}",\n'
-            + f'{EDITOR_INDENT * 4 if withIndent else ""}letter = "{self.letter}",\n'
-            + f'{EDITOR_INDENT * 4 if withIndent else ""}date = "{self.date}",\n'
-            + f"{EDITOR_INDENT * 4 if withIndent else ''}moshafList = listOf(\n"
-            + f"{EDITOR_INDENT * 6 if withIndent else ''}{moshafList}\n"
-            + f"{EDITOR_INDENT * 4 if withIndent else ''})\n"
-            f"{EDITOR_INDENT * 2 if withIndent else ''})"
-        )
-
-    def __str__(self) -> str:
-        """
-        Returns a string representation of the Reciter object.
+def ktString(value: str | None) -> str:
+    """
+    Escapes a value so it can be safely placed inside a Kotlin string literal.
 
-        :return: (str) A string representation of the Reciter object.
-        """
-        return self.__toString__(withIndent=True)
+    :param value: (str | None) The value to escape, non-string values (e.g. a null field) are rendered as is.
+    :return: (str) The escaped value.
+    """
+    if not isinstance(value, str):
+        return str(value)
 
-    def __repr__(self) -> str:
-        """
-        Returns a string representation of the Reciter object.
+    # almost no value needs escaping, return those as is instead of translating them into a copy
+    if KOTLIN_STRING_SPECIAL_CHARACTERS.search(value) is None:
+        return value
 
-        :return: (str) A string representation of the Reciter object.
-        """
-        return self.__toString__()
+    return value.translate(KOTLIN_STRING_ESCAPES)
 
 
-def toDataClass(data: dict, cls: type[T]) -> T:
+def surahToKotlin(surah: SurahData) -> str:
     """
-    Converts a dictionary to a dataclass object.
+    Converts a Surah to its Kotlin `Surah` constructor call.
 
-    :param data: (dict) The dictionary to convert.
-    :param cls: (type[T]) The dataclass type to convert to.
-    :return: (T) The converted dataclass object.
+    :param surah: (SurahData) The Surah to convert.
+    :return: (str) The Kotlin representation of the Surah.
     """
-    initKwargs = {}
-
-    for field in fields(cls):
-        fieldType = field.type
-        fieldName = field.name
-
-        # If using Annotated, extract the Annotated type
-        if get_origin(fieldType) is Annotated:
-            realType, annotatedType = get_args(fieldType)
-            fieldType = realType
-            fieldName = annotatedType
+    return SURAH_TEMPLATE % (
+        surah["id"],
+        ktString(surah["name"]),
+        surah["start_page"],
+        surah["end_page"],
+        surah["makkia"],
+        surah["type"],
+    )
 
-        if fieldName not in data:
-            continue
 
-        fieldValue = data[fieldName]
+def moshafToKotlin(moshaf: MoshafData) -> str:
+    """
+    Converts a Moshaf to its Kotlin `Moshaf` constructor call, indented as an item of a Reciter's Moshaf list.
 
-        fieldName = field.name
+    :param moshaf: (MoshafData) The Moshaf to convert.
+    :return: (str) The Kotlin representation of the Moshaf.
+    """
+    return MOSHAF_TEMPLATE % (
+        moshaf["id"],
+        ktString(moshaf["name"]),
+        ktString(moshaf["server"]),
+        moshaf["surah_total"],
+        moshaf["moshaf_type"],
+        ktString(moshaf["surah_list"]),
+    )
 
-        # Nested dataclass
-        if is_dataclass(fieldType):
-            initKwargs[fieldName] = toDataClass(fieldValue, fieldType)
 
-        # List of dataclasses
-        elif (
-            hasattr(fieldType, "__origin__")
-            and get_origin(fieldType) is list
-            and is_dataclass(get_args(fieldType)[0])
-        ):
-            inner = get_args(fieldType)[0]
-            initKwargs[fieldName] = [toDataClass(item, inner) for item in fieldValue]
+def reciterToKotlin(reciter: ReciterData) -> str:
+    """
+    Converts a Reciter to its Kotlin `Reciter` constructor call, indented as an item of the `sampleReciters` list.
 
-        else:
-            initKwargs[fieldName] = fieldValue
+    :param reciter: (ReciterData) The Reciter to convert.
+    :return: (str) The Kotlin representation of the Reciter.
+    """
+    moshafList = MOSHAF_SEPARATOR.join(
+        [moshafToKotlin(moshaf) for moshaf in reciter["moshaf"]]
+    )
 
-    return cls(**initKwargs)
+    return RECITER_TEMPLATE % (
+        reciter["id"],
+        ktString(reciter["name"]),
+        ktString(reciter["letter"]),
+        ktString(reciter["date"]),
+        moshafList,
+    )
 
 
-def sendRequest(url: str) -> Response | None:
+def sendRequest(url: str, headers: dict[str, str] | None = None) -> Response | None:
     """
     Sends a GET request to the specified URL.
 
     With a retry strategy defined as follows:
         1. request timeout is 3s
         2. retry count is 3 times spaced by an
-           exponential delay as 250ms, 500ms, 1s
+           exponential delay as 0ms, 500ms, 1s
+        3. only connection errors, read errors and
+           500, 502, 503, 504 responses are retried
 
     so the max delay of this function if there's
     a connection error is:
-    3s + 250ms + 3s + 500ms + 3s + 1s = 10s 750ms
+    3s + 0ms + 3s + 500ms + 3s + 1s + 3s = 13s 500ms
+
+    The request is sent through the shared :data:`SESSION`, so
+    consecutive requests reuse pooled keep-alive connections.
 
     :param url: (str) The URL to send the request to.
+    :param headers: (dict[str, str] | None) Extra headers to send with the request. Defaults to None.
     :return: (Response) The response from the server.
     """
-
-    """
-    delay between retries is calculated as:
-    backoff factor * (2 ^ number of previous retries)
-    so 250ms, 500ms, 1s
-    """
-    retryStrategy = Retry(total=3, backoff_factor=0.125)
-    adapter = HTTPAdapter(max_retries=retryStrategy)
-    session = requests.session()
-    session.mount(prefix="http://", adapter=adapter)
-    session.mount(prefix="https://", adapter=adapter)
-
     try:
-        response = session.get(url=url, timeout=3) # timeout in seconds
+        # timeout in seconds
+        response = SESSION.get(url=url, headers=headers, timeout=3)
+        # retries don't raise on an exhausted error status, so check it here
+        response.raise_for_status()
     except RequestException as ex:
         print(f"ERROR: {ex}", file=sys.stderr)
         return None
@@ -314,34 +363,156 @@ def sendRequest(url: str) -> Response | None:
     return response
 
 
-def getReciters() -> list[Reciter] | None:
+def parseContent(content: bytes) -> dict | None:
     """
-    Fetches reciters data from mp3quran.net API.
+    Parses the JSON content of an API response.
+
+    :param content: (bytes) The raw content to parse.
+    :return: (dict | None) The parsed content, or None if it isn't valid JSON.
+    """
+    try:
+        return jsonLoads(content)
+    except ValueError:
+        return None
+
+
+def writeCacheFile(path: Path, content: bytes) -> None:
+    """
+    Atomically writes a cache file, so an interrupted run never leaves a partial entry behind.
 
-    :return: (list[Reciter]) A list of Reciter objects.
+    :param path: (Path) The path of the cache file.
+    :param content: (bytes) The content to write.
     """
-    response = sendRequest(url="https://mp3quran.net/api/v3/reciters?language=ar")
+    tempPath = path.with_suffix(f"{path.suffix}.tmp")
+    tempPath.write_bytes(content)
+    os.replace(tempPath, path)
+
+
+def fetchContent(url: str, useCache: bool = True) -> dict | None:
+    """
+    Fetches and parses the JSON content of the specified URL, using the on-disk response cache.
+
+    The content of each URL is stored in :data:`CACHE_DIR` alongside its `ETag`:
+        1. if the cached content is younger than :data:`CACHE_EXPIRY_SECONDS`,
+           it is returned without touching the network
+        2. otherwise the request is sent with `If-None-Match`, and the cached
+           content is reused if the server answers `304 Not Modified`
+
+    Cached content that isn't valid JSON is dropped and fetched again, and
+    responses that aren't valid JSON are never cached.
+
+    :param url: (str) The URL to fetch.
+    :param useCache: (bool) Whether to read cached content. Defaults to True.
+    :return: (dict | None) The parsed content of the response, or None if the request failed.
+    """
+    cacheKey = sha1(url.encode()).hexdigest()
+    contentPath = CACHE_DIR / f"{cacheKey}.json"
+    etagPath = CACHE_DIR / f"{cacheKey}.etag"
+    headers = {}
+    cachedContent = None
+
+    if useCache and contentPath.exists():
+        cachedContent = parseContent(contentPath.read_bytes())
+
+        if cachedContent is None:
+            # a corrupt entry, drop it and fetch the content again
+            contentPath.unlink(missing_ok=True)
+            etagPath.unlink(missing_ok=True)
+        elif time() - contentPath.stat().st_mtime < CACHE_EXPIRY_SECONDS:
+            return cachedContent
+        elif etagPath.exists():
+            headers["If-None-Match"] = etagPath.read_text(encoding="utf-8")
+
+    response = sendRequest(url=url, headers=headers)
 
     if response is None:
         return None
+
+    if response.status_code == 304 and cachedContent is not None:
+        # content didn't change, refresh the cache timestamp
+        contentPath.touch()
+        return cachedContent
+
+    content = parseContent(response.content)
+
+    if content is None:
+        print(f"ERROR: {url} returned invalid JSON", file=sys.stderr)
+        return None
+
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    # drop the old ETag first, so it's never paired with newer content
+    etagPath.unlink(missing_ok=True)
+    writeCacheFile(contentPath, response.content)
+
+    etag = response.headers.get("ETag")
+    if etag:
+        writeCacheFile(etagPath, etag.encode())
+
+    return content
+
+
+def getReciters(useCache: bool = True) -> list[ReciterData] | None:
+    """
+    Fetches reciters data from mp3quran.net API.
+
+    :param useCache: (bool) Whether to use the on-disk response cache. Defaults to True.
+    :return: (list[ReciterData]) A list of Reciter dictionaries.
+    """
+    content = fetchContent(
+        url="https://mp3quran.net/api/v3/reciters?language=ar", useCache=useCache
+    )
+
+    if content is None:
+        return None
     else:
-        data = response.json()["reciters"]
-        return [toDataClass(item, Reciter) for item in data]
+        return content["reciters"]
 
 
-def getSurahs() -> list[Surah] | None:
+def getSurahs(useCache: bool = True) -> list[SurahData] | None:
     """
     Fetches surahs data from mp3quran.net API.
 
-    :return: (list[Surah]) A list of Surah objects.
+    :param useCache: (bool) Whether to use the on-disk response cache. Defaults to True.
+    :return: (list[SurahData]) A list of Surah dictionaries.
     """
-    response = sendRequest(url="https://mp3quran.net/api/v3/suwar?language=ar")
+    content = fetchContent(
+        url="https://mp3quran.net/api/v3/suwar?language=ar", useCache=useCache
+    )
 
-    if response is None:
+    if content is None:
         return None
     else:
-        data = response.json()["suwar"]
-        return [toDataClass(item, Surah) for item in data]
+        return content["suwar"]
+
+
+def getOutputHash(reciters: list[ReciterData], surahs: list[SurahData]) -> str:
+    """
+    Computes the content hash of the generated SampleData.kt.
+
+    The hash covers the fetched data and this script itself, so changing either the
+    upstream data or the way the Kotlin code is generated invalidates it.
+
+    :param reciters: (list[ReciterData]) The fetched reciters.
+    :param surahs: (list[SurahData]) The fetched surahs.
+    :return: (str) The hex digest of the hash.
+    """
+    outputHash = blake2b(digest_size=16)
+    outputHash.update(Path(__file__).read_bytes())
+    outputHash.update(jsonDumps(reciters, sort_keys=True).encode())
+    outputHash.update(jsonDumps(surahs, sort_keys=True).encode())
+
+    return outputHash.hexdigest()
+
+
+def getFileHash(path: str) -> str:
+    """
+    Computes the content hash of a file.
+
+    :param path: (str) The path of the file.
+    :return: (str) The hex digest of the hash.
+    """
+    with open(path, "rb") as file:
+        return blake2b(file.read(), digest_size=16).hexdigest()
 
 
 def main() -> None:
@@ -354,6 +525,29 @@ def main() -> None:
 
     This function does not take any parameters and does not return anything.
     """
+    parser = argparse.ArgumentParser(
+        description="Generate Kotlin Sample Data for the AlQuran Android App."
+    )
+
+    # Define the --verbose flag. If present, the generated Kotlin code is also printed to stdout.
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Print the generated Kotlin code to stdout while writing it",
+    )
+
+    # Define the --no-cache flag. If present, the cached API responses are ignored and re-fetched,
+    # and SampleData.kt is regenerated even if it is up to date.
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore the cached API responses and fetch them again, and regenerate SampleData.kt even if it is up to date",
+    )
+
+    args = parser.parse_args()
+    isVerbose = args.verbose
+    useCache = not args.no_cache
+
     projectRootDir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     outputPath = os.path.join(
         f"{projectRootDir}/mobile/src/main/java/com/hifnawy/alquran/utils/SampleData.kt"
@@ -361,8 +555,17 @@ def main() -> None:
 
     print("[*] Fetching data...")
 
-    print("[*] Fetching reciters...")
-    reciters = getReciters()
+    # both endpoints are independent, so fetch them concurrently
+    # and only wait for the slower of the two
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        print("[*] Fetching reciters...")
+        recitersFuture = executor.submit(getReciters, useCache)
+
+        print("[*] Fetching surahs...")
+        surahsFuture = executor.submit(getSurahs, useCache)
+
+        reciters = recitersFuture.result()
+        surahs = surahsFuture.result()
 
     if reciters:
         print("[✓] Reciters data fetched successfully.")
@@ -370,8 +573,6 @@ def main() -> None:
         print("[✗] Reciters data fetching failed.", file=sys.stderr)
         exit(1)
 
-    print("[*] Fetching surahs...")
-    surahs = getSurahs()
     if surahs:
         print("[✓] Surahs data fetched successfully.")
     else:
@@ -380,23 +581,17 @@ def main() -> None:
 
     print("[✓] Data fetched successfully.")
 
-    print("[*] Converting to Reciters Kotlin...")
-    kotlinReciters = ",\n\n".join(str(reciter) for reciter in reciters)
-    print("[✓] Reciters Conversion to Kotlin completed.")
-
-    print("[*] Creating Reciters Kotlin list...")
-    kotlinRecitersList = f"val sampleReciters = listOf(\n{kotlinReciters}\n)\n"
-    print("[✓] Reciters Kotlin list created.")
-
-    print("[*] Converting to Surahs Kotlin...")
-    kotlinSurahs = f",\n{EDITOR_INDENT * 2}".join(str(surah) for surah in surahs)
-    print("[✓] Surahs Conversion to Kotlin completed.")
-
-    print("[*] Creating Surahs Kotlin list...")
-    kotlinSurahsList = (
-        f"val sampleSurahs = listOf(\n{EDITOR_INDENT * 2}{kotlinSurahs}\n)\n"
-    )
-    print("[✓] Surahs Kotlin list created.")
+    # skip the generation when SampleData.kt was already generated from the same data and wasn't modified since
+    outputHash = getOutputHash(reciters, surahs)
+    if (
+        useCache
+        and os.path.exists(outputPath)
+        and OUTPUT_HASH_PATH.exists()
+        and OUTPUT_HASH_PATH.read_text(encoding="utf-8")
+        == f"{outputHash}\n{getFileHash(outputPath)}"
+    ):
+        print(f"[✓] {outputPath} is up to date.")
+        return
 
     fileHeaders = [
         '@file:Suppress("SpellCheckingInspection")\n',
@@ -407,22 +602,38 @@ def main() -> None:
         "import com.hifnawy.alquran.shared.model.asReciterId\n",
     ]
 
-    print(f"[*] Generating {outputPath}...", end="\n\n")
-    with open(outputPath, "w", encoding="utf-8") as file:
-        for header in fileHeaders:
-            file.write(f"{header}\n")
-            print(header)
+    # collect the whole Kotlin code and write it in one go, the file is only a few hundred KiB
+    kotlinParts = [f"{header}\n" for header in fileHeaders]
 
-        for line in kotlinRecitersList.splitlines():
-            file.write(f"{line}\n")
-            print(line)
+    print("[*] Converting to Reciters Kotlin...")
+    kotlinParts.append("val sampleReciters = listOf(\n")
+    kotlinParts.append(",\n\n".join([reciterToKotlin(reciter) for reciter in reciters]))
+    kotlinParts.append("\n)\n\n")
+    print("[✓] Reciters Conversion to Kotlin completed.")
 
-        file.write("\n")
-        print()
+    print("[*] Converting to Surahs Kotlin...")
+    kotlinParts.append(f"val sampleSurahs = listOf(\n{INDENT_2}")
+    kotlinParts.append(
+        f",\n{INDENT_2}".join([surahToKotlin(surah) for surah in surahs])
+    )
+    kotlinParts.append("\n)\n")
+    print("[✓] Surahs Conversion to Kotlin completed.")
+
+    print(f"[*] Generating {outputPath}...", end="\n\n" if isVerbose else "\n")
+    # a buffer larger than the output lets the parts coalesce into a single write(2)
+    with open(outputPath, "w", encoding="utf-8", buffering=1 << 20) as file:
+        file.writelines(kotlinParts)
+
+    # write the hash only after SampleData.kt is complete, and atomically, so it never describes a partial file
+    OUTPUT_HASH_PATH.parent.mkdir(parents=True, exist_ok=True)
+    outputHashTempPath = OUTPUT_HASH_PATH.with_suffix(".tmp")
+    outputHashTempPath.write_text(
+        f"{outputHash}\n{getFileHash(outputPath)}", encoding="utf-8"
+    )
+    os.replace(outputHashTempPath, OUTPUT_HASH_PATH)
 
-        for line in kotlinSurahsList.splitlines():
-            file.write(f"{line}\n")
-            print(line)
+    if isVerbose:
+        sys.stdout.writelines(kotlinParts)
         print()
     print(f"[✓] {outputPath} generated successfully.")
 
@@ -2,20 +2,28 @@
 This script generates Surah images with optional canvas display.
 
 Usage:
-    python generateSurahDrawables.py [--headless]
+    python generateSurahDrawables.py [--headless] [--jobs JOBS] [--palette] [--optimize]
 
 Options:
     --headless: Generate Surah images Headless (without canvas display)
+    --jobs: Number of parallel sketches used to generate the Surah images in headless mode
+    --palette: Save the Surah images as 16-color palette PNGs (lossy, much smaller files)
+    --optimize: Losslessly recompress the Surah images with oxipng/optipng in headless mode (slow)
 """
 
 import argparse
+import multiprocessing
 import os
+import queue
+import shutil
+import subprocess
 import sys
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from time import sleep
 
 import py5
+from PIL import Image
 
 sys.stdout.reconfigure(encoding="utf-8")
 sys.stderr.reconfigure(encoding="utf-8")
@@ -34,8 +42,35 @@ parser.add_argument(
     help="Generate Surah images Headless (without canvas display)",
 )
 
+# Define the --jobs option. Each job runs its own headless sketch (and JVM) rendering a share of the Surahs,
+# so the default is capped, booting more JVMs than that costs more than it saves for ~115 small images.
+parser.add_argument(
+    "--jobs",
+    type=int,
+    default=min(4, os.cpu_count() or 1),
+    help="Number of parallel sketches used to generate the Surah images in headless mode (defaults to 4)",
+)
+
+# Define the --palette flag. If present, images are quantized to a 16-color palette before saving.
+parser.add_argument(
+    "--palette",
+    action="store_true",
+    help="Save the Surah images as 16-color palette PNGs (lossy, much smaller files)",
+)
+
+# Define the --optimize flag. If present, the generated images are recompressed with oxipng/optipng
+# at their highest (slow) level, which takes much longer than generating them.
+parser.add_argument(
+    "--optimize",
+    action="store_true",
+    help="Losslessly recompress the Surah images with oxipng/optipng in headless mode (slow)",
+)
+
 args = parser.parse_args()
 isHeadless = args.headless
+jobCount = max(1, args.jobs)
+isPalette = args.palette
+isOptimize = args.optimize
 
 # print(f"{isHeadless = }")
 
@@ -60,12 +95,15 @@ angle = 0
 # Flag to indicate if Surah data is still loading (used in interactive mode).
 loading = True
 
-# Index of the current Surah being displayed/generated.
+# Index of the current Surah being displayed (used in interactive mode).
 surahIndex = 0
 
+# Indices of the Surahs generated by this process' sketch (used in headless mode).
+headlessSurahIndices: list[int] = []
+
 # noinspection SpellCheckingInspection
-# Hardcoded list of Surah names in Arabic. Index 0 is a placeholder.
-surahs = [
+# Hardcoded tuple of Surah names in Arabic. Index 0 is a placeholder.
+surahs = (
     "اْسْمُ اٌلسُورَةِ",  # Surah Name (placeholder)
     "ٱلْفَاتِحَةِ",
     "ٱلْبَقَرَةِ",
@@ -181,7 +219,7 @@ surahs = [
     "ٱلْإِخْلَاصِ",
     "ٱلْفَلَقِ",
     "ٱلنَّاسِ",
-]
+)
 
 # ---Timing constants for the animation cycle (in milliseconds) ---
 
@@ -225,6 +263,26 @@ surahFont: py5.Py5Font | None = None  # Py5 font object.
 # Surah Al-Kafiron is too wide to fit in a 512x512 canvas with fontSize 150
 surahFontSpecial: py5.Py5Font | None = None  # Py5 font object.
 
+# Font used for each Surah index, built once the fonts are created (Surah Al-Kafiron uses the special font).
+fontForSurahIndex: tuple[py5.Py5Font, ...] = ()
+
+# Horizontal offset of the Surah name for each Surah index (Surah Al-Kafiron is shifted to fit).
+textXOffsetForSurahIndex: tuple[int, ...] = tuple(
+    10 if index == 109 else 0 for index in range(len(surahs))
+)
+
+# Last font set on each renderer, keyed by the renderer's id(), to skip redundant text_font() calls.
+# The renderer is kept alongside its font, so a recreated renderer reusing a freed id() is never mistaken for it.
+lastFontForRenderer: dict[int, tuple["RendererType", py5.Py5Font]] = {}
+
+# --- Theme colors ---
+
+# Background theme colors indexed by `surahIndex & 1`, computed once the sketch is running.
+themeColors: tuple[int, int] | None = None
+
+# Mix of the two theme colors used as the base background, computed once the sketch is running.
+themeMixColor: int | None = None
+
 # --- Canvas and off-screen rendering ---
 
 # Window width
@@ -236,6 +294,33 @@ sketchHeight = 512
 # Py5Graphics object used for off-screen rendering and image saving (exporter).
 exporter: py5.Py5Graphics | None = None
 
+# Py5Graphics object used only for the blurred image, so the blur filter never touches 'exporter'.
+# Created on first use, as only the sketch rendering Surah index 0 needs it.
+blurExporter: py5.Py5Graphics | None = None
+
+# Py5Graphics object used to pre-render the Surah names on a transparent background (interactive mode).
+surahTextRenderer: py5.Py5Graphics | None = None
+
+# Pre-rendered ring of the loading indicator (interactive mode).
+loadingRingImage: py5.Py5Image | None = None
+
+# Pre-rendered Surah names at full opacity, keyed by Surah index (interactive mode).
+surahImageCache: dict[int, py5.Py5Image] = {}
+
+# Frames waiting to be written as PNG files, bounded to cap memory (each 512x512 frame is ~1 MiB).
+imageSaveQueue: queue.Queue[tuple[py5.Py5Image | None, str | None]] = queue.Queue(
+    maxsize=8
+)
+
+# Background thread writing the frames in 'imageSaveQueue'.
+imageWriter: threading.Thread | None = None
+
+# First error raised while writing a frame, re-raised on the render thread by 'stopImageWriter()'.
+imageWriterError: OSError | ValueError | None = None
+
+# Files written successfully by 'imageWriter', reported back by each headless worker.
+generatedFilenames: list[str] = []
+
 # Type alias for clarity: a renderer can be the main py5 sketch or the Py5Graphics exporter.
 RendererType = py5.Py5Graphics | type(py5)
 """Renderer Type, either `py5.Py5Graphics` or `py5`"""
@@ -252,49 +337,149 @@ def getSurahs() -> None:
 
     # Replace hardcoded list with API data
     # surahs = py5.load_json("https://mp3quran.net/api/v3/suwar?language=ar")
-    sleep(3)  # Simulated delay for debugging or demonstrating loading
     loading = False
 
     previousTimestamp = py5.millis()
 
 
-def saveFrame(surahName: str, filename: str, blur: bool = False) -> None:
+def saveFrame(surahIndex: int, surahName: str, filename: str) -> None:
     """
-    Renders the current Surah content at full opacity (alpha 255) to the off-screen
+    Renders the given Surah content at full opacity (alpha 255) to the off-screen
     exporter and saves it as a PNG file in the 'drawables' directory.
 
+    :param surahIndex: int - the index of the Surah
     :param surahName - the name of the Surah
     :param filename: str
-    :param blur: bool - blur the whole content
     """
     global exporter
 
     exporter.begin_draw()
 
     # Render content at full opacity (255) to the off-screen buffer
-    drawSurahContent(surahName, exporter, 255, blur)
+    drawSurahContent(surahIndex, surahName, exporter, 255)
 
     exporter.end_draw()
 
-    # Generate filename: surah_001.png, surah_002.png, or surah_name.png for index 0.
-    exporter.save(filename)
+    # Hand a snapshot of the frame to the writer thread, so the PNG encoding overlaps the next render.
+    imageSaveQueue.put((exporter.get_pixels(), filename))
 
-    print(f"[✓] generated: {Path(filename).resolve()}")
 
+def saveBlurredFrame(surahIndex: int, surahName: str, filename: str) -> None:
+    """
+    Renders the given Surah content at full opacity (alpha 255) to the dedicated
+    blur exporter, blurs it and saves it as a PNG file in the 'drawables' directory.
 
-def loadingIndicator() -> None:
+    :param surahIndex: int - the index of the Surah
+    :param surahName - the name of the Surah
+    :param filename: str
     """
-    Draws a rotating, fading bar indicator to show the sketch is busy loading data.
-    Uses transformation matrices (push_matrix/pop_matrix) for rotation.
+    global blurExporter
+
+    if blurExporter is None:
+        blurExporter = py5.create_graphics(sketchWidth, sketchHeight, py5.JAVA2D)
+
+    blurExporter.begin_draw()
+
+    # Render content at full opacity (255) to the off-screen buffer, then blur the whole content
+    drawSurahContent(surahIndex, surahName, blurExporter, 255)
+    blurExporter.apply_filter(py5.BLUR, 7)
+
+    blurExporter.end_draw()
+
+    # Hand a snapshot of the frame to the writer thread, so the PNG encoding overlaps the next render.
+    imageSaveQueue.put((blurExporter.get_pixels(), filename))
+
+
+def writeImages() -> None:
+    """
+    Writes the queued frames as PNG files until a `(None, None)` sentinel is received.
+
+    Runs on the background image writer thread started by :func:`startImageWriter`.
+    The queue keeps being drained after a failed write, so the render thread never blocks on it,
+    and the first error is kept in 'imageWriterError' for :func:`stopImageWriter` to re-raise.
     """
-    global angle, sketchWidth
+    global imageWriterError
+
+    while True:
+        image, filename = imageSaveQueue.get()
+
+        if image is None:
+            break
+
+        # Skip the remaining frames once a write failed, they would most likely fail the same way
+        if imageWriterError is not None:
+            continue
+
+        try:
+            if isPalette:
+                savePaletteImage(image, filename)
+            else:
+                image.save(filename)
+        # Pillow raises OSError for I/O failures (missing directory, full disk) and ValueError for bad filenames
+        except (OSError, ValueError) as ex:
+            print(
+                f"[✗] failed to generate: {Path(filename).resolve()}", file=sys.stderr
+            )
+            imageWriterError = ex
+            continue
 
-    setBackgroundColor(py5)
+        generatedFilenames.append(filename)
+        print(f"[✓] generated: {Path(filename).resolve()}")
 
-    py5.push_matrix()
-    # Move the origin to the center of the canvas
-    py5.translate(py5.width / 2, py5.height / 2)
-    py5.rotate(angle)
+
+def savePaletteImage(image: py5.Py5Image, filename: str) -> None:
+    """
+    Saves the image as an 8-bit palette PNG quantized to 16 colors.
+
+    The images only contain the two theme colors and anti-aliased white text,
+    so 16 colors keep them visually identical at a fraction of the RGB file size.
+
+    :param image: py5.Py5Image - the image to save
+    :param filename: str
+    """
+    image.load_np_pixels()
+
+    # np_pixels is ARGB, drop the alpha channel like Py5Image.save() does by default
+    rgbImage = Image.fromarray(image.np_pixels[:, :, 1:])
+    rgbImage.quantize(colors=16, method=Image.Quantize.MEDIANCUT).save(
+        filename, optimize=True
+    )
+
+
+def startImageWriter() -> None:
+    """
+    Starts the background thread writing the frames queued by :func:`saveFrame`.
+    """
+    global imageWriter, imageWriterError
+
+    imageWriterError = None
+    imageWriter = threading.Thread(target=writeImages, daemon=True)
+    imageWriter.start()
+
+
+def stopImageWriter() -> None:
+    """
+    Waits for the background thread to write all the queued frames and stops it.
+
+    :raises OSError | ValueError: the first error raised while writing a frame, if any
+    """
+    imageSaveQueue.put((None, None))
+    imageWriter.join()
+
+    if imageWriterError is not None:
+        raise imageWriterError
+
+
+def createLoadingRingImage() -> py5.Py5Image:
+    """
+    Renders the static ring of fading bars drawn by the loading indicator.
+
+    The ring is drawn once on a transparent background, so every frame of the loading
+    indicator only has to rotate and blit it.
+
+    :return: py5.Py5Image - the loading ring, centered on a sketch-sized image
+    """
+    global sketchWidth, sketchHeight
 
     barCount = 80
     barWidth = 20
@@ -303,22 +488,52 @@ def loadingIndicator() -> None:
     # Radius calculated with padding
     radius = (sketchWidth / 4) - barHeight - 10
 
+    ringRenderer = py5.create_graphics(sketchWidth, sketchHeight, py5.JAVA2D)
+    ringRenderer.begin_draw()
+    ringRenderer.clear()
+    ringRenderer.stroke_weight(0)
+
+    # Move the origin to the center of the canvas
+    ringRenderer.translate(sketchWidth / 2, sketchHeight / 2)
+
     for index in range(barCount):
         # Calculate the angular position of the bar
         theta = index * py5.TWO_PI / barCount
 
-        py5.push_matrix()
-        py5.rotate(theta)
+        ringRenderer.push_matrix()
+        ringRenderer.rotate(theta)
         # Calculate alpha for fading effect (fades out from index 0)
         alpha = int(255 - index * (255 / barCount))
         alpha = max(0, alpha)
 
         # Draw the bar with calculated alpha
-        py5.stroke(255, alpha)
-        py5.fill(255, alpha)
-        py5.rect(radius, -barWidth / 2, barHeight, barWidth, barCornerRadius)
+        ringRenderer.stroke(255, alpha)
+        ringRenderer.fill(255, alpha)
+        ringRenderer.rect(radius, -barWidth / 2, barHeight, barWidth, barCornerRadius)
+
+        ringRenderer.pop_matrix()
+
+    ringRenderer.end_draw()
+
+    return ringRenderer.get_pixels()
+
+
+def loadingIndicator() -> None:
+    """
+    Draws a rotating, fading bar indicator to show the sketch is busy loading data.
+    Uses transformation matrices (push_matrix/pop_matrix) to rotate the pre-rendered ring.
+    """
+    global angle, sketchWidth, sketchHeight
 
-        py5.pop_matrix()
+    setBackgroundColor(surahIndex, py5)
+
+    py5.push_matrix()
+    # Move the origin to the center of the canvas
+    py5.translate(py5.width / 2, py5.height / 2)
+    py5.rotate(angle)
+
+    # Blit the ring centered on the rotated origin
+    py5.image(loadingRingImage, -sketchWidth / 2, -sketchHeight / 2)
 
     py5.pop_matrix()
 
@@ -327,29 +542,48 @@ def loadingIndicator() -> None:
 
 
 # --- Visual Functions ---
-def setBackgroundColor(renderer: RendererType, alpha: int = 255) -> None:
+def useFont(renderer: RendererType, font: py5.Py5Font) -> None:
+    """
+    Sets the text font of the renderer, skipping the call if the font is already set.
+
+    :param renderer: RendererType
+    :param font: py5.Py5Font
+    """
+    rendererId = id(renderer)
+    lastRenderer, lastFont = lastFontForRenderer.get(rendererId, (None, None))
+
+    if lastRenderer is not renderer or lastFont is not font:
+        renderer.text_font(font)
+        lastFontForRenderer[rendererId] = (renderer, font)
+
+
+def setBackgroundColor(
+    surahIndex: int, renderer: RendererType, alpha: int = 255
+) -> None:
     """
     Sets the background color with alternating themes based on the Surah index.
     The 'alpha' parameter controls the overall opacity of the theme color.
 
+    :param surahIndex: int
     :param renderer: RendererType
     :param alpha: int
     """
-    global sketchWidth, sketchHeight
+    global sketchWidth, sketchHeight, themeColors, themeMixColor
 
-    red = py5.color(221, 95, 86)
-    darkTeal = py5.color(51, 110, 106)
+    # The colors are constant, but py5.color() needs a running sketch, so compute them on first use
+    if themeColors is None:
+        red = py5.color(221, 95, 86)
+        darkTeal = py5.color(51, 110, 106)
 
-    # Set a mixed color as the base background
-    mix = py5.lerp_color(red, darkTeal, 0.5)
+        # Set a mixed color as the base background
+        themeMixColor = py5.lerp_color(red, darkTeal, 0.5)
+        # Even Surah indices use dark teal, odd ones use red
+        themeColors = (darkTeal, red)
 
-    renderer.background(mix)
+    renderer.background(themeMixColor)
 
     # Choose theme color based on odd/even Surah index
-    if surahIndex % 2 != 0:
-        renderer.fill(red, alpha)
-    else:
-        renderer.fill(darkTeal, alpha)
+    renderer.fill(themeColors[surahIndex & 1], alpha)
 
     # Draw the solid theme color rectangle over the background
     renderer.stroke(0, 0)
@@ -358,20 +592,38 @@ def setBackgroundColor(renderer: RendererType, alpha: int = 255) -> None:
 
 
 def drawSurahContent(
-    surahName: str, renderer: RendererType, alpha: int, blur: bool = False
+    surahIndex: int,
+    surahName: str,
+    renderer: RendererType,
+    alpha: int,
 ) -> None:
     """
-    Renders the two-line Surah name text centered on the canvas.
-    The text opacity is controlled by the 'alpha' parameter.
+    Renders the themed background and the two-line Surah name text centered on the canvas.
+    The background and text opacity is controlled by the 'alpha' parameter.
 
+    :param surahIndex: int - the index of the Surah
     :param surahName: str - the name of the Surah
     :param renderer: RendererType - the renderer type
     :param alpha: int the alpha of the background and the text
-    :param blur: bool - blur the whole content
     """
-    global surahFont, surahFontSpecial, textYOffset, fontHeight
+    setBackgroundColor(surahIndex, renderer, alpha)
+
+    drawSurahText(surahIndex, surahName, renderer, alpha)
+
+
+def drawSurahText(
+    surahIndex: int, surahName: str, renderer: RendererType, alpha: int
+) -> None:
+    """
+    Renders the two-line Surah name text centered on the canvas.
+    The text opacity is controlled by the 'alpha' parameter.
 
-    setBackgroundColor(renderer, alpha)
+    :param surahIndex: int - the index of the Surah
+    :param surahName: str - the name of the Surah
+    :param renderer: RendererType - the renderer type
+    :param alpha: int the alpha of the text
+    """
+    global surahFont, textYOffset, fontHeight
 
     renderer.text_align(py5.CENTER, py5.CENTER)
 
@@ -385,22 +637,42 @@ def drawSurahContent(
     # Special handling for the placeholder Surah (index 0)
     if surahIndex == 0:
         words = surahName.split(" ")
-        renderer.text_font(surahFont)
+        useFont(renderer, surahFont)
         renderer.text(words[0], centerX, centerY - textYOffset)
         renderer.text(words[1], centerX, centerY + textYOffset)
     # Handling for actual Surahs (index > 0)
     else:
-        if surahIndex == 109:
-            renderer.text_font(surahFontSpecial)
-            renderer.text("سُورَةُ", centerX, centerY - textYOffset)
-            renderer.text(surahName, centerX + 10, centerY + textYOffset)
-        else:
-            renderer.text_font(surahFont)
-            renderer.text("سُورَةُ", centerX, centerY - textYOffset)
-            renderer.text(surahName, centerX, centerY + textYOffset)
+        useFont(renderer, fontForSurahIndex[surahIndex])
+        renderer.text("سُورَةُ", centerX, centerY - textYOffset)
+        renderer.text(
+            surahName,
+            centerX + textXOffsetForSurahIndex[surahIndex],
+            centerY + textYOffset,
+        )
 
-    if blur:
-        renderer.apply_filter(exporter.BLUR, 7)
+
+def getSurahImage(surahIndex: int, surahName: str) -> py5.Py5Image:
+    """
+    Returns the Surah name text pre-rendered at full opacity on a transparent background.
+
+    The text is shaped and rasterized only the first time a Surah is requested, every
+    following frame just blits the cached image.
+
+    :param surahIndex: int - the index of the Surah
+    :param surahName: str - the name of the Surah
+    :return: py5.Py5Image - the pre-rendered Surah name
+    """
+    image = surahImageCache.get(surahIndex)
+
+    if image is None:
+        surahTextRenderer.begin_draw()
+        surahTextRenderer.clear()
+        drawSurahText(surahIndex, surahName, surahTextRenderer, 255)
+        surahTextRenderer.end_draw()
+
+        image = surahImageCache[surahIndex] = surahTextRenderer.get_pixels()
+
+    return image
 
 
 # --- Py5 Setup ---
@@ -427,42 +699,61 @@ def setup() -> None:
     Loads font, creates the off-screen exporter, and handles mode-specific logic.
     """
     global \
+        blurExporter, \
         exporter, \
+        fontForSurahIndex, \
         fontPath, \
         fontSize, \
         fontSizeSpecial, \
+        loadingRingImage, \
         surahFont, \
         surahFontSpecial, \
-        surahIndex
+        surahTextRenderer
 
     py5.frame_rate(144)  # High frame rate for smooth animation (interactive mode)
     surahFont = py5.create_font(fontPath, fontSize)
     surahFontSpecial = py5.create_font(fontPath, fontSizeSpecial)
+    fontForSurahIndex = tuple(
+        surahFontSpecial if index == 109 else surahFont for index in range(len(surahs))
+    )
+    # The renderers are (re)created below, forget the fonts set on any previous ones
+    lastFontForRenderer.clear()
+
     # Create a separate, off-screen graphics context for saving images
     exporter = py5.create_graphics(sketchWidth, sketchHeight, py5.JAVA2D)
+    # The blur exporter is only created by saveBlurredFrame(), drop any previous one
+    blurExporter = None
 
-    # Headless mode: Loop through all Surahs, save the image, and immediately exit.
+    startImageWriter()
+
+    # Headless mode: Loop through this sketch's share of the Surahs, save the images, and immediately exit.
     if isHeadless:
-        currentSurah = surahs[0]
-        filename = f"{drawablesPath}/surah_name_blurred.png"
-        saveFrame(currentSurah, filename, True)
-
-        for index in range(len(surahs)):
-            # Update index before saving to ensure correct filename and content
-            surahIndex = index
-            currentSurah = surahs[surahIndex]
+        for index in headlessSurahIndices:
+            currentSurah = surahs[index]
+
+            if index == 0:
+                filename = f"{drawablesPath}/surah_name_blurred.png"
+                saveBlurredFrame(index, currentSurah, filename)
+
             filename = (
-                f"{drawablesPath}/surah_{surahIndex:03d}.png"
-                if surahIndex != 0
+                f"{drawablesPath}/surah_{index:03d}.png"
+                if index != 0
                 else f"{drawablesPath}/surah_name.png"
             )
-            saveFrame(currentSurah, filename)
+            saveFrame(index, currentSurah, filename)
+
+        # Wait for the pending frames to be written
+        stopImageWriter()
 
         # Terminate the sketch after all frames are generated
         py5.exit_sketch()
 
     # Interactive mode: Start API data loading in a background thread
     else:
+        # Create an off-screen graphics context for pre-rendering the Surah names
+        surahTextRenderer = py5.create_graphics(sketchWidth, sketchHeight, py5.JAVA2D)
+        loadingRingImage = createLoadingRingImage()
+
         threading.Thread(target=getSurahs, daemon=True).start()
 
 
@@ -503,13 +794,16 @@ def draw() -> None:
         # Save the fully visible frame from the previous cycle
         if surahIndex == 0:
             filename = f"{drawablesPath}/surah_name_blurred.png"
-            saveFrame(currentSurah, filename, True)
+            saveBlurredFrame(surahIndex, currentSurah, filename)
 
             filename = f"{drawablesPath}/surah_name.png"
-            saveFrame(currentSurah, filename)
+            saveFrame(surahIndex, currentSurah, filename)
         else:
             filename = f"{drawablesPath}/surah_{surahIndex:03d}.png"
-            saveFrame(currentSurah, filename)
+            saveFrame(surahIndex, currentSurah, filename)
+
+        # The Surah is never displayed again, release its pre-rendered image
+        surahImageCache.pop(surahIndex, None)
 
         # Advance the cycle timestamp and index
         previousTimestamp += cycleDuration
@@ -519,16 +813,63 @@ def draw() -> None:
         # Check for end of Surah list
         if surahIndex >= len(surahs):
             py5.no_loop()  # Stop the draw loop
+            stopImageWriter()  # Wait for the pending frames to be written
             print("All Surahs displayed.")
             return
 
+        currentSurah = surahs[surahIndex]
+
     if surahIndex != 0:
-        # Draw the content of the current Surah with the calculated alpha
-        drawSurahContent(currentSurah, py5, alpha)
+        # Draw the background and blit the pre-rendered Surah name with the calculated alpha
+        setBackgroundColor(surahIndex, py5, alpha)
+        py5.tint(255, alpha)
+        py5.image(getSurahImage(surahIndex, currentSurah), 0, 0)
+        py5.no_tint()
     else:
         loadingIndicator()
 
 
+# --- Post-processing ---
+def optimizeImages(filenames: list[str]) -> None:
+    """
+    Losslessly recompresses the generated PNG files to shrink the drawables shipped in the APK.
+
+    Uses `oxipng` (multithreaded on its own) when installed, falls back to running `optipng`
+    on all files in parallel, and skips the step if neither is available.
+    Optimizer failures are reported on stderr.
+
+    :param filenames: list[str] - the PNG files to optimize
+    """
+    if oxipng := shutil.which("oxipng"):
+        print("[*] optimizing images with oxipng...")
+        result = subprocess.run(
+            [oxipng, "-o", "max", "--strip", "safe", *filenames], check=False
+        )
+        isOptimized = result.returncode == 0
+    elif optipng := shutil.which("optipng"):
+        print("[*] optimizing images with optipng...")
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            results = list(
+                executor.map(
+                    lambda filename: subprocess.run(
+                        [optipng, "-quiet", "-o7", filename], check=False
+                    ),
+                    filenames,
+                )
+            )
+        isOptimized = all(result.returncode == 0 for result in results)
+    else:
+        print(
+            "[!] neither oxipng nor optipng is installed, skipping image optimization."
+        )
+        return
+
+    if isOptimized:
+        print("[✓] images optimized.")
+    else:
+        print("[✗] image optimization failed.", file=sys.stderr)
+
+
 def generate() -> None:
     """
     Runs the Py5 sketch in interactive mode.
@@ -544,12 +885,36 @@ def generate() -> None:
     )
 
 
-def generateHeadless() -> None:
+def getSurahFilenames(surahIndex: int) -> list[str]:
     """
-    Runs the Py5 sketch in headless mode.
+    Returns the image files generated for a Surah.
+
+    :param surahIndex: int - the index of the Surah
+    :return: list[str] - the blurred and plain name images for index 0, the Surah image otherwise
+    """
+    if surahIndex == 0:
+        return [
+            f"{drawablesPath}/surah_name_blurred.png",
+            f"{drawablesPath}/surah_name.png",
+        ]
+
+    return [f"{drawablesPath}/surah_{surahIndex:03d}.png"]
 
-    This function runs the Py5 sketch in headless mode, which means it does not have a display window.
+
+def generateHeadlessChunk(surahIndices: list[int]) -> list[str]:
     """
+    Runs the Py5 sketch in headless mode for a share of the Surahs.
+
+    This function runs the Py5 sketch in headless mode, which means it does not have a display window,
+    and only generates the images of the given Surah indices.
+
+    :param surahIndices: list[int] - the indices of the Surahs to generate
+    :return: list[str] - the image files that were written successfully
+    """
+    global headlessSurahIndices
+
+    headlessSurahIndices = surahIndices
+
     py5.run_sketch(
         sketch_functions={
             "settings": settings,
@@ -557,6 +922,67 @@ def generateHeadless() -> None:
         }
     )
 
+    # py5 only prints the errors raised by the sketch, so report what was actually written instead
+    return generatedFilenames
+
+
+def generateHeadless() -> None:
+    """
+    Runs the Py5 sketch in headless mode.
+
+    Every Surah image is independent, so the Surahs are split into disjoint chunks,
+    one per job, and each chunk is rendered by its own sketch in a separate process
+    that is never reused for another chunk.
+
+    Surahs whose images weren't written (a failed frame or a failed worker) are reported on stderr,
+    and make the script exit with a non-zero status.
+    """
+    workerCount = min(jobCount, len(surahs))
+    # Interleave the indices so each chunk gets a similar mix of short and long Surah names
+    chunks = [
+        list(range(index, len(surahs), workerCount)) for index in range(workerCount)
+    ]
+
+    chunkFilenames: list[list[str]] = []
+
+    if workerCount == 1:
+        chunkFilenames.append(generateHeadlessChunk(chunks[0]))
+    else:
+        # py5 (Processing/Java) is not fork-safe, so every worker is a freshly spawned interpreter,
+        # and a sketch can only run once per process, so every worker is replaced after its chunk
+        with multiprocessing.get_context("spawn").Pool(
+            workerCount, maxtasksperchild=1
+        ) as pool:
+            results = [
+                pool.apply_async(generateHeadlessChunk, (chunk,)) for chunk in chunks
+            ]
+
+            for result in results:
+                try:
+                    chunkFilenames.append(result.get())
+                # A worker can fail in any way (e.g. its JVM failing to start), which only fails its own chunk
+                except Exception as ex:  # noqa: BLE001
+                    print(f"[✗] headless worker failed: {ex!r}", file=sys.stderr)
+                    chunkFilenames.append([])
+
+    generated = [filename for filenames in chunkFilenames for filename in filenames]
+    generatedSet = set(generated)
+    failedSurahIndices = [
+        index
+        for chunk in chunks
+        for index in chunk
+        if not generatedSet.issuperset(getSurahFilenames(index))
+    ]
+
+    for index in failedSurahIndices:
+        print(f"[✗] failed to generate Surah {index}: {surahs[index]}", file=sys.stderr)
+
+    if isOptimize:
+        optimizeImages(generated)
+
+    if failedSurahIndices:
+        sys.exit(1)
+
 
 def main() -> None:
    """Runs the Py5 sketch.